@@ -18,6 +18,7 @@ import logging
 import time
 import types
 from collections import defaultdict
+from functools import lru_cache
 from sys import intern
 from time import monotonic as monotonic_time
 from typing import (
@@ -102,6 +103,16 @@ UNIQUE_INDEX_BACKGROUND_UPDATES = {
 }
 
 
+@lru_cache(maxsize=2048)
+def _make_sql_one_line(sql: str) -> str:
+    """Strip newlines out of SQL so that the loggers in the DB are on one line.
+
+    This is done for every query we run, and we only have a bounded set of
+    distinct SQL strings, so the results are cached.
+    """
+    return " ".join(line.strip() for line in sql.splitlines() if line.strip())
+
+
 class _PoolConnection(Connection):
     """
     A Connection from twisted.enterprise.adbapi.Connection.
@@ -446,10 +457,6 @@ class LoggingTransaction:
                 f"executescript only exists for sqlite driver, not {type(self.database_engine)}"
             )
 
-    def _make_sql_one_line(self, sql: str) -> str:
-        "Strip newlines out of SQL so that the loggers in the DB are on one line"
-        return " ".join(line.strip() for line in sql.splitlines() if line.strip())
-
     def _do_execute(
         self,
         func: Callable[Concatenate[str, P], R],
@@ -458,7 +465,7 @@ class LoggingTransaction:
         **kwargs: P.kwargs,
     ) -> R:
         # Generate a one-line version of the SQL to better log it.
-        one_line_sql = self._make_sql_one_line(sql)
+        one_line_sql = _make_sql_one_line(sql)
 
         # TODO(paul): Maybe use 'info' and 'debug' for values?
         sql_logger.debug("[SQL] {%s} %s", self.name, one_line_sql)
@@ -488,7 +495,7 @@ class LoggingTransaction:
         finally:
             secs = time.time() - start
             sql_logger.debug("[SQL time] {%s} %f sec", self.name, secs)
-            sql_query_timer.labels(sql.split()[0]).observe(secs)
+            sql_query_timer.labels(sql.split(None, 1)[0]).observe(secs)
 
     def close(self) -> None:
         self.txn.close()
@@ -2079,9 +2086,6 @@ class DatabasePool:
         # (This matches the order needed for the query)
         args = [tuple(x) + tuple(y) for x, y in zip(value_values, key_values)]
 
-        for ks, vs in zip(key_values, value_values):
-            args.append(tuple(vs) + tuple(ks))
-
         # 'col1 = ?, col2 = ?, ...'
         set_clause = ", ".join(f"{n} = ?" for n in value_names)
 
@@ -2379,30 +2383,49 @@ class DatabasePool:
 
         Also returns the minimum stream ID.
         """
+        txn = db_conn.cursor(txn_name="get_cache_dict")
+        result = self.get_cache_dict_txn(
+            txn, table, entity_column, stream_column, max_value, limit
+        )
+        txn.close()
 
-        # This may return many rows for the same entity, but the `limit` is only
-        # a suggestion so we don't care that much.
+        return result
+
+    @staticmethod
+    def get_cache_dict_txn(
+        txn: LoggingTransaction,
+        table: str,
+        entity_column: str,
+        stream_column: str,
+        max_value: int,
+        limit: int = 100000,
+    ) -> Tuple[Dict[Any, int], int]:
+        """As `get_cache_dict`, but using an existing cursor, so that stores
+        prefilling several caches on startup can share one.
+        """
+
+        # The inner query may return many rows for the same entity, but the
+        # `limit` is only a suggestion so we don't care that much. We pick out
+        # the most recent change for each entity in the database, so that only
+        # one row per entity needs to be sent back to us.
         #
         # Note: Some stream tables can have multiple rows with the same stream
         # ID. Instead of handling this with complicated SQL, we instead simply
         # add one to the returned minimum stream ID to ensure correctness.
         sql = f"""
-            SELECT {entity_column}, {stream_column}
-            FROM {table}
-            ORDER BY {stream_column} DESC
-            LIMIT ?
+            SELECT {entity_column}, MAX({stream_column})
+            FROM (
+                SELECT {entity_column}, {stream_column}
+                FROM {table}
+                ORDER BY {stream_column} DESC
+                LIMIT ?
+            ) AS c
+            GROUP BY {entity_column}
         """
 
-        txn = db_conn.cursor(txn_name="get_cache_dict")
         txn.execute(sql, (limit,))
 
-        # The rows come out in reverse stream ID order, so we want to keep the
-        # stream ID of the first row for each entity.
-        cache: Dict[Any, int] = {}
-        for row in txn:
-            cache.setdefault(row[0], int(row[1]))
-
-        txn.close()
+        cache: Dict[Any, int] = {row[0]: int(row[1]) for row in txn}
 
         if cache:
             # We add one here as we don't know if we have all rows for the
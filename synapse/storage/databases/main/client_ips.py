@@ -503,20 +503,38 @@ class ClientIpWorkerStore(ClientIpBackgroundUpdateStore, MonthlyActiveUsersWorke
             keys giving the column names from the devices table.
         """
 
-        keyvalues = {"user_id": user_id}
-        if device_id is not None:
-            keyvalues["device_id"] = device_id
+        def get_last_client_ip_by_device_txn(
+            txn: LoggingTransaction,
+        ) -> List[Tuple[str, Optional[str], Optional[str], Optional[int]]]:
+            sql = """
+                SELECT device_id, ip, user_agent, last_seen FROM devices
+                WHERE user_id = ?
+            """
+            args = [user_id]
+            if device_id is not None:
+                sql += " AND device_id = ?"
+                args.append(device_id)
+
+            txn.execute(sql, args)
+            return cast(
+                List[Tuple[str, Optional[str], Optional[str], Optional[int]]],
+                txn.fetchall(),
+            )
 
-        res = cast(
-            List[DeviceLastConnectionInfo],
-            await self.db_pool.simple_select_list(
-                table="devices",
-                keyvalues=keyvalues,
-                retcols=("user_id", "ip", "user_agent", "device_id", "last_seen"),
-            ),
+        rows = await self.db_pool.runInteraction(
+            "get_last_client_ip_by_device", get_last_client_ip_by_device_txn
         )
 
-        return {(d["user_id"], d["device_id"]): d for d in res}
+        return {
+            (user_id, did): {
+                "user_id": user_id,
+                "device_id": did,
+                "ip": ip,
+                "user_agent": user_agent,
+                "last_seen": last_seen,
+            }
+            for did, ip, user_agent, last_seen in rows
+        }
 
     async def _get_user_ip_and_agents_from_database(
         self, user: UserID, since_ts: int = 0
@@ -588,10 +606,7 @@ class ClientIpWorkerStore(ClientIpBackgroundUpdateStore, MonthlyActiveUsersWorke
             now = int(self._clock.time_msec())
         key = (user_id, access_token, ip)
 
-        try:
-            last_seen = self.client_ip_last_seen.get(key)
-        except KeyError:
-            last_seen = None
+        last_seen = self.client_ip_last_seen.get(key)
 
         # Rate-limited inserts
         if last_seen is not None and (now - last_seen) < LAST_SEEN_GRANULARITY:
@@ -106,8 +106,12 @@ class DeviceInboxWorkerStore(SQLBaseStore):
             )
 
         max_device_inbox_id = self._device_inbox_id_gen.get_current_token()
-        device_inbox_prefill, min_device_inbox_id = self.db_pool.get_cache_dict(
-            db_conn,
+
+        # Prefill both the inbox and outbox stream caches using a single cursor.
+        txn = db_conn.cursor(txn_name="prefill_device_inbox_caches")
+
+        device_inbox_prefill, min_device_inbox_id = self.db_pool.get_cache_dict_txn(
+            txn,
             "device_inbox",
             entity_column="user_id",
             stream_column="stream_id",
@@ -122,8 +126,8 @@ class DeviceInboxWorkerStore(SQLBaseStore):
 
         # The federation outbox and the local device inbox uses the same
         # stream_id generator.
-        device_outbox_prefill, min_device_outbox_id = self.db_pool.get_cache_dict(
-            db_conn,
+        device_outbox_prefill, min_device_outbox_id = self.db_pool.get_cache_dict_txn(
+            txn,
             "device_federation_outbox",
             entity_column="destination",
             stream_column="stream_id",
@@ -136,6 +140,8 @@ class DeviceInboxWorkerStore(SQLBaseStore):
             prefilled_cache=device_outbox_prefill,
         )
 
+        txn.close()
+
     def process_replication_rows(
         self,
         stream_name: str,
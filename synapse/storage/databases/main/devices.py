@@ -107,8 +107,12 @@ class DeviceWorkerStore(RoomMemberWorkerStore, EndToEndKeyWorkerStore):
         )
 
         device_list_max = self._device_list_id_gen.get_current_token()
-        device_list_prefill, min_device_list_id = self.db_pool.get_cache_dict(
-            db_conn,
+
+        # Prefill all of the device list stream caches using a single cursor.
+        txn = db_conn.cursor(txn_name="prefill_device_list_caches")
+
+        device_list_prefill, min_device_list_id = self.db_pool.get_cache_dict_txn(
+            txn,
             "device_lists_stream",
             entity_column="user_id",
             stream_column="stream_id",
@@ -124,8 +128,8 @@ class DeviceWorkerStore(RoomMemberWorkerStore, EndToEndKeyWorkerStore):
         (
             user_signature_stream_prefill,
             user_signature_stream_list_id,
-        ) = self.db_pool.get_cache_dict(
-            db_conn,
+        ) = self.db_pool.get_cache_dict_txn(
+            txn,
             "user_signature_stream",
             entity_column="from_user_id",
             stream_column="stream_id",
@@ -141,8 +145,8 @@ class DeviceWorkerStore(RoomMemberWorkerStore, EndToEndKeyWorkerStore):
         (
             device_list_federation_prefill,
             device_list_federation_list_id,
-        ) = self.db_pool.get_cache_dict(
-            db_conn,
+        ) = self.db_pool.get_cache_dict_txn(
+            txn,
             "device_lists_outbound_pokes",
             entity_column="destination",
             stream_column="stream_id",
@@ -155,6 +159,8 @@ class DeviceWorkerStore(RoomMemberWorkerStore, EndToEndKeyWorkerStore):
             prefilled_cache=device_list_federation_prefill,
         )
 
+        txn.close()
+
         if hs.config.worker.run_background_tasks:
             self._clock.looping_call(
                 self._prune_old_outbound_device_pokes, 60 * 60 * 1000
@@ -14,7 +14,7 @@
 import calendar
 import logging
 import time
-from typing import TYPE_CHECKING, Dict, List, Tuple, cast
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, cast
 
 from synapse.metrics import GaugeBucketCollector
 from synapse.metrics.background_process_metrics import wrap_as_background_process
@@ -33,6 +33,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# How long, in milliseconds, to reuse the result of `count_daily_users` for.
+DAILY_USERS_CACHE_TTL_MS = 60 * 1000
+
 # Collect metrics on the number of forward extremities that exist.
 _extremities_collecter = GaugeBucketCollector(
     "synapse_forward_extremities",
@@ -74,6 +77,10 @@ class ServerMetricsStore(EventPushActionsWorkerStore, SQLBaseStore):
         # Used in _generate_user_daily_visits to keep track of progress
         self._last_user_visit_update = self._get_start_of_day()
 
+        # The last result of `count_daily_users`, as a tuple of when it was
+        # calculated (in ms) and the count.
+        self._daily_users_count: Optional[Tuple[int, int]] = None
+
     @wrap_as_background_process("read_forward_extremities")
     async def _read_forward_extremities(self) -> None:
         def fetch(txn: LoggingTransaction) -> List[Tuple[int, int]]:
@@ -212,11 +219,23 @@ class ServerMetricsStore(EventPushActionsWorkerStore, SQLBaseStore):
     async def count_daily_users(self) -> int:
         """
         Counts the number of users who used this homeserver in the last 24 hours.
+
+        The result may be up to a minute out of date, as it is cached to avoid
+        rescanning `user_ips` each time the metrics are collected.
         """
-        yesterday = int(self._clock.time_msec()) - (1000 * 60 * 60 * 24)
-        return await self.db_pool.runInteraction(
+        now = int(self._clock.time_msec())
+        if (
+            self._daily_users_count is not None
+            and now - self._daily_users_count[0] < DAILY_USERS_CACHE_TTL_MS
+        ):
+            return self._daily_users_count[1]
+
+        yesterday = now - (1000 * 60 * 60 * 24)
+        count = await self.db_pool.runInteraction(
             "count_daily_users", self._count_users, yesterday
         )
+        self._daily_users_count = (now, count)
+        return count
 
     async def count_monthly_users(self) -> int:
         """
@@ -24,7 +24,6 @@ from synapse.storage.database import (
 from synapse.storage.databases.main.cache import CacheInvalidationWorkerStore
 from synapse.storage.engines import PostgresEngine
 from synapse.storage.engines._base import IsolationLevel
-from synapse.storage.types import Connection
 from synapse.storage.util.id_generators import (
     AbstractStreamIdGenerator,
     MultiWriterIdGenerator,
@@ -90,7 +89,14 @@ class PresenceStore(PresenceBackgroundUpdateStore, CacheInvalidationWorkerStore)
             )
 
         self.hs = hs
-        self._presence_on_startup = self._get_active_presence(db_conn)
+
+        # The active presence is only used by the presence handler to restore
+        # its in-memory state and timeouts. When presence is disabled it never
+        # sets up the timeouts and reads presence from the database on demand,
+        # so we can skip this (potentially large) query on startup.
+        self._presence_on_startup: List[UserPresenceState] = []
+        if hs.config.server.use_presence:
+            self._presence_on_startup = self._get_active_presence(db_conn)
 
         presence_cache_prefill, min_presence_val = self.db_pool.get_cache_dict(
             db_conn,
@@ -409,7 +415,9 @@ class PresenceStore(PresenceBackgroundUpdateStore, CacheInvalidationWorkerStore)
     def get_current_presence_token(self) -> int:
         return self._presence_id_gen.get_current_token()
 
-    def _get_active_presence(self, db_conn: Connection) -> List[UserPresenceState]:
+    def _get_active_presence(
+        self, db_conn: LoggingDatabaseConnection
+    ) -> List[UserPresenceState]:
         """Fetch non-offline presence from the database so that we can register
         the appropriate time outs.
         """
@@ -422,15 +430,34 @@ class PresenceStore(PresenceBackgroundUpdateStore, CacheInvalidationWorkerStore)
             " WHERE state != ?"
         )
 
-        txn = db_conn.cursor()
+        txn = db_conn.cursor(txn_name="_get_active_presence")
         txn.execute(sql, (PresenceState.OFFLINE,))
-        rows = self.db_pool.cursor_to_dict(txn)
-        txn.close()
 
-        for row in rows:
-            row["currently_active"] = bool(row["currently_active"])
+        # This can be a lot of rows on large servers, so we build the presence
+        # states straight from the cursor rather than going via a list of dicts.
+        presence_states = [
+            UserPresenceState(
+                user_id,
+                state,
+                last_active_ts,
+                last_federation_update_ts,
+                last_user_sync_ts,
+                status_msg,
+                bool(currently_active),
+            )
+            for (
+                user_id,
+                state,
+                last_active_ts,
+                last_federation_update_ts,
+                last_user_sync_ts,
+                status_msg,
+                currently_active,
+            ) in txn
+        ]
+        txn.close()
 
-        return [UserPresenceState(**row) for row in rows]
+        return presence_states
 
     def take_presence_startup_info(self) -> List[UserPresenceState]:
         active_on_startup = self._presence_on_startup
@@ -202,12 +202,12 @@ class PushRulesWorkerStore(
 
             def have_push_rules_changed_txn(txn: LoggingTransaction) -> bool:
                 sql = (
-                    "SELECT COUNT(stream_id) FROM push_rules_stream"
+                    "SELECT 1 FROM push_rules_stream"
                     " WHERE user_id = ? AND ? < stream_id"
+                    " LIMIT 1"
                 )
                 txn.execute(sql, (user_id, last_id))
-                (count,) = cast(Tuple[int], txn.fetchone())
-                return bool(count)
+                return txn.fetchone() is not None
 
             return await self.db_pool.runInteraction(
                 "have_push_rules_changed", have_push_rules_changed_txn
@@ -337,8 +337,12 @@ class PushRuleStore(PushRulesWorkerStore):
     ):
         super().__init__(database, db_conn, hs)
 
-        self._push_rule_id_gen = IdGenerator(db_conn, "push_rules", "id")
-        self._push_rules_enable_id_gen = IdGenerator(db_conn, "push_rules_enable", "id")
+        (
+            self._push_rule_id_gen,
+            self._push_rules_enable_id_gen,
+        ) = IdGenerator.bulk_initialise(
+            db_conn, [("push_rules", "id"), ("push_rules_enable", "id")]
+        )
 
     async def add_push_rule(
         self,
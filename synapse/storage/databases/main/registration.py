@@ -2207,8 +2207,12 @@ class RegistrationStore(StatsStore, RegistrationBackgroundUpdateStore):
             hs.config.server.request_token_inhibit_3pid_errors
         )
 
-        self._access_tokens_id_gen = IdGenerator(db_conn, "access_tokens", "id")
-        self._refresh_tokens_id_gen = IdGenerator(db_conn, "refresh_tokens", "id")
+        (
+            self._access_tokens_id_gen,
+            self._refresh_tokens_id_gen,
+        ) = IdGenerator.bulk_initialise(
+            db_conn, [("access_tokens", "id"), ("refresh_tokens", "id")]
+        )
 
         # If support for MSC3866 is enabled and configured to require approval for new
         # account, we will create new users with an 'approved' flag set to false.
@@ -47,6 +47,7 @@ from synapse.storage.database import (
     LoggingDatabaseConnection,
     LoggingTransaction,
 )
+from synapse.storage.engines import PostgresEngine
 from synapse.storage.types import Cursor
 from synapse.storage.util.sequence import PostgresSequenceGenerator
 
@@ -67,7 +68,32 @@ class IdGenerator:
         column: str,
     ):
         self._lock = threading.Lock()
-        self._next_id = _load_current_id(db_conn, table, column)
+        (self._next_id,) = _load_current_ids_from_tables(db_conn, [(table, column)])
+
+    @classmethod
+    def _from_current_id(cls, current_id: int) -> "IdGenerator":
+        """Create a generator from an initial value that has already been fetched
+        from the database.
+        """
+        id_gen = cls.__new__(cls)
+        id_gen._lock = threading.Lock()
+        id_gen._next_id = current_id
+        return id_gen
+
+    @classmethod
+    def bulk_initialise(
+        cls, db_conn: LoggingDatabaseConnection, tables: Sequence[Tuple[str, str]]
+    ) -> List["IdGenerator"]:
+        """Create an `IdGenerator` for each of the given (table, column) pairs,
+        fetching all of their initial values in a single query.
+
+        Returns:
+            A generator for each pair, in the same order as `tables`.
+        """
+        return [
+            cls._from_current_id(current_id)
+            for current_id in _load_current_ids_from_tables(db_conn, tables)
+        ]
 
     def get_next(self) -> int:
         with self._lock:
@@ -75,22 +101,51 @@ class IdGenerator:
             return self._next_id
 
 
-def _load_current_id(
-    db_conn: LoggingDatabaseConnection, table: str, column: str, step: int = 1
-) -> int:
-    cur = db_conn.cursor(txn_name="_load_current_id")
-    if step == 1:
-        cur.execute("SELECT MAX(%s) FROM %s" % (column, table))
+def _load_current_ids_from_tables(
+    db_conn: LoggingDatabaseConnection,
+    tables: Sequence[Tuple[str, str]],
+    step: int = 1,
+) -> List[int]:
+    """Fetch the current ID of each of the given (table, column) pairs.
+
+    All of the lookups are done in a single query, so that generators sourcing
+    their initial value from several tables only need one round-trip to the
+    database on startup.
+
+    Returns:
+        The current ID for each pair, in the same order as `tables`.
+    """
+    aggregate = "MAX" if step > 0 else "MIN"
+
+    # Empty tables are treated as being at `step`, and the ID is never allowed
+    # to be below (or above, for negative steps) `step`.
+    if isinstance(db_conn.engine, PostgresEngine):
+        clamp = "GREATEST" if step > 0 else "LEAST"
     else:
-        cur.execute("SELECT MIN(%s) FROM %s" % (column, table))
+        # SQLite's multi-argument MAX and MIN are scalar functions.
+        clamp = aggregate
+
+    sql = "SELECT %s" % (
+        ", ".join(
+            "%s(COALESCE((SELECT %s(%s) FROM %s), %d), %d)"
+            % (clamp, aggregate, column, table, step, step)
+            for table, column in tables
+        ),
+    )
+
+    cur = db_conn.cursor(txn_name="_load_current_ids_from_tables")
+    cur.execute(sql)
     result = cur.fetchone()
     assert result is not None
-    (val,) = result
     cur.close()
-    current_id = int(val) if val else step
-    res = (max if step > 0 else min)(current_id, step)
-    logger.info("Initialising stream generator for %s(%s): %i", table, column, res)
-    return res
+
+    results = []
+    for (table, column), val in zip(tables, result):
+        res = int(val)
+        logger.info("Initialising stream generator for %s(%s): %i", table, column, res)
+        results.append(res)
+
+    return results
 
 
 class AbstractStreamIdGenerator(metaclass=abc.ABCMeta):
@@ -198,12 +253,12 @@ class StreamIdGenerator(AbstractStreamIdGenerator):
         assert step != 0
         self._lock = threading.Lock()
         self._step: int = step
-        self._current: int = _load_current_id(db_conn, table, column, step)
-        self._is_writer = is_writer
-        for table, column in extra_tables:
-            self._current = (max if step > 0 else min)(
-                self._current, _load_current_id(db_conn, table, column, step)
+        self._current: int = (max if step > 0 else min)(
+            _load_current_ids_from_tables(
+                db_conn, [(table, column), *extra_tables], step
             )
+        )
+        self._is_writer = is_writer
 
         # We use this as an ordered set, as we want to efficiently append items,
         # remove items and get the first item. Since we insert IDs in order, the
@@ -13,7 +13,7 @@
 # limitations under the License.
 
 from typing import Optional, cast
-from unittest.mock import Mock, call
+from unittest.mock import Mock, call, patch
 
 from parameterized import parameterized
 from signedjson.key import generate_signing_key
@@ -40,6 +40,7 @@ from synapse.rest import admin
 from synapse.rest.client import room
 from synapse.server import HomeServer
 from synapse.storage.database import LoggingDatabaseConnection
+from synapse.storage.databases.main.presence import PresenceStore
 from synapse.types import JsonDict, UserID, get_domain_from_id
 from synapse.util import Clock
 
@@ -731,6 +732,38 @@ class PresenceHandlerInitTestCase(unittest.HomeserverTestCase):
         self.assertEqual(state.state, sync_state)
 
 
+class PresenceStoreStartupTestCase(unittest.HomeserverTestCase):
+    def make_homeserver(self, reactor: MemoryReactor, clock: Clock) -> HomeServer:
+        # Spy on the startup query, still running it so that the store is set up
+        # as normal.
+        with patch.object(
+            PresenceStore,
+            "_get_active_presence",
+            autospec=True,
+            side_effect=PresenceStore._get_active_presence,
+        ) as self.get_active_presence:
+            return self.setup_test_homeserver()
+
+    def default_config(self) -> JsonDict:
+        config = super().default_config()
+        # Disable background tasks on this worker so that the PresenceHandler isn't
+        # loaded (and doesn't consume the startup info) until we request it.
+        config["run_background_tasks_on"] = "other"
+        return config
+
+    def test_active_presence_loaded_on_startup(self) -> None:
+        """Active presence should be read from the database on startup."""
+        self.get_active_presence.assert_called_once()
+
+    @unittest.override_config({"presence": {"enabled": False}})
+    def test_active_presence_not_loaded_when_disabled(self) -> None:
+        """Active presence should not be read on startup if presence is disabled."""
+        self.get_active_presence.assert_not_called()
+
+        main_store = self.hs.get_datastores().main
+        self.assertEqual(main_store.take_presence_startup_info(), [])
+
+
 class PresenceHandlerTestCase(BaseMultiWorkerStreamTestCase):
     user_id = "@test:server"
     user_id_obj = UserID.from_string(user_id)
@@ -196,6 +196,29 @@ class SQLBaseStoreTestCase(unittest.TestCase):
             [3, 4, 1, 2],
         )
 
+    @defer.inlineCallbacks
+    def test_update_many(self) -> Generator["defer.Deferred[object]", object, None]:
+        yield defer.ensureDeferred(
+            self.datastore.db_pool.simple_update_many(
+                table="tablename",
+                key_names=("colA", "colB"),
+                key_values=[(1, 2), (3, 4)],
+                value_names=("colC",),
+                value_values=[(5,), (6,)],
+                desc="test_update_many",
+            )
+        )
+
+        # Each row should be sent to the database exactly once. (On SQLite,
+        # `execute_batch` is implemented with the cursor's `executemany`.)
+        self.mock_txn.executemany.assert_called_once()
+        sql, args = self.mock_txn.executemany.call_args[0]
+        self.assertEqual(
+            " ".join(sql.split()),
+            "UPDATE tablename SET colC = ? WHERE colA = ? AND colB = ?",
+        )
+        self.assertEqual(args, [(5, 1, 2), (6, 3, 4)])
+
     @defer.inlineCallbacks
     def test_delete_one(self) -> Generator["defer.Deferred[object]", object, None]:
         self.mock_txn.rowcount = 1
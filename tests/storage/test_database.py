@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Callable, Tuple
+from typing import Any, Callable, Dict, Tuple
 from unittest.mock import Mock, call
 
 from twisted.internet import defer
@@ -133,6 +133,52 @@ class ExecuteScriptTestCase(unittest.HomeserverTestCase):
         )
 
 
+class GetCacheDictTestCase(unittest.HomeserverTestCase):
+    """Tests for `DatabasePool.get_cache_dict`."""
+
+    def prepare(self, reactor: MemoryReactor, clock: Clock, hs: HomeServer) -> None:
+        self.store = hs.get_datastores().main
+        self.db_pool: DatabasePool = self.store.db_pool
+
+        def _setup_db(txn: LoggingTransaction) -> None:
+            txn.execute("CREATE TABLE foo (entity TEXT, stream_id BIGINT)")
+            txn.execute_batch(
+                "INSERT INTO foo VALUES (?, ?)",
+                [("a", 1), ("b", 2), ("a", 3), ("c", 4), ("b", 5)],
+            )
+
+        self.get_success(self.db_pool.runInteraction("_setup_db", _setup_db))
+
+    def _get_cache_dict(self, limit: int) -> Tuple[Dict[Any, int], int]:
+        def run(conn: LoggingDatabaseConnection) -> Tuple[Dict[Any, int], int]:
+            return self.db_pool.get_cache_dict(
+                conn,
+                "foo",
+                entity_column="entity",
+                stream_column="stream_id",
+                max_value=5,
+                limit=limit,
+            )
+
+        return self.get_success(self.db_pool.runWithConnection(run))
+
+    def test_latest_change_per_entity(self) -> None:
+        """Test that the most recent stream ID is returned for each entity."""
+        cache, min_val = self._get_cache_dict(limit=100)
+        self.assertEqual(cache, {"a": 3, "b": 5, "c": 4})
+        self.assertEqual(min_val, 4)
+
+    def test_limit(self) -> None:
+        """Test that only the most recent `limit` rows are considered."""
+        cache, min_val = self._get_cache_dict(limit=3)
+        self.assertEqual(cache, {"a": 3, "b": 5, "c": 4})
+        self.assertEqual(min_val, 4)
+
+        cache, min_val = self._get_cache_dict(limit=2)
+        self.assertEqual(cache, {"b": 5, "c": 4})
+        self.assertEqual(min_val, 5)
+
+
 class CallbacksTestCase(unittest.HomeserverTestCase):
     """Tests for transaction callbacks."""
 
@@ -23,13 +23,54 @@ from synapse.storage.database import (
 )
 from synapse.storage.engines import IncorrectDatabaseSetup
 from synapse.storage.types import Cursor
-from synapse.storage.util.id_generators import MultiWriterIdGenerator, StreamIdGenerator
+from synapse.storage.util.id_generators import (
+    IdGenerator,
+    MultiWriterIdGenerator,
+    StreamIdGenerator,
+)
 from synapse.util import Clock
 
 from tests.unittest import HomeserverTestCase
 from tests.utils import USE_POSTGRES_FOR_TESTS
 
 
+class IdGeneratorTestCase(HomeserverTestCase):
+    def prepare(self, reactor: MemoryReactor, clock: Clock, hs: HomeServer) -> None:
+        self.store = hs.get_datastores().main
+        self.db_pool: DatabasePool = self.store.db_pool
+
+        self.get_success(self.db_pool.runInteraction("_setup_db", self._setup_db))
+
+    def _setup_db(self, txn: LoggingTransaction) -> None:
+        txn.execute("CREATE TABLE foobar (id BIGINT NOT NULL)")
+        txn.execute("INSERT INTO foobar VALUES (123)")
+        txn.execute("CREATE TABLE foobar2 (id BIGINT NOT NULL)")
+
+    def test_initial_value(self) -> None:
+        """Check that we read the current ID from the DB."""
+
+        def _create(conn: LoggingDatabaseConnection) -> IdGenerator:
+            return IdGenerator(conn, "foobar", "id")
+
+        id_gen = self.get_success_or_raise(self.db_pool.runWithConnection(_create))
+        self.assertEqual(id_gen.get_next(), 124)
+        self.assertEqual(id_gen.get_next(), 125)
+
+    def test_bulk_initialise(self) -> None:
+        """Check that each generator is initialised from its own table."""
+
+        def _create(conn: LoggingDatabaseConnection) -> List[IdGenerator]:
+            return IdGenerator.bulk_initialise(
+                conn, [("foobar", "id"), ("foobar2", "id")]
+            )
+
+        id_gen, id_gen2 = self.get_success_or_raise(
+            self.db_pool.runWithConnection(_create)
+        )
+        self.assertEqual(id_gen.get_next(), 124)
+        self.assertEqual(id_gen2.get_next(), 2)
+
+
 class StreamIdGeneratorTestCase(HomeserverTestCase):
     def prepare(self, reactor: MemoryReactor, clock: Clock, hs: HomeServer) -> None:
         self.store = hs.get_datastores().main
@@ -64,6 +105,46 @@ class StreamIdGeneratorTestCase(HomeserverTestCase):
         id_gen = self._create_id_generator()
         self.assertEqual(id_gen.get_current_token(), 123)
 
+    def test_initial_value_extra_tables(self) -> None:
+        """Check that the largest current token across all the tables is used."""
+
+        def _setup_extra_tables(txn: LoggingTransaction) -> None:
+            txn.execute("CREATE TABLE foobar2 (stream_id BIGINT NOT NULL)")
+            txn.execute("INSERT INTO foobar2 VALUES (456)")
+            txn.execute("CREATE TABLE foobar3 (stream_id BIGINT NOT NULL)")
+
+        self.get_success(
+            self.db_pool.runInteraction("_setup_extra_tables", _setup_extra_tables)
+        )
+
+        def _create(conn: LoggingDatabaseConnection) -> StreamIdGenerator:
+            return StreamIdGenerator(
+                db_conn=conn,
+                notifier=self.hs.get_replication_notifier(),
+                table="foobar",
+                column="stream_id",
+                extra_tables=[("foobar2", "stream_id"), ("foobar3", "stream_id")],
+            )
+
+        id_gen = self.get_success_or_raise(self.db_pool.runWithConnection(_create))
+        self.assertEqual(id_gen.get_current_token(), 456)
+
+    def test_initial_value_backwards(self) -> None:
+        """Check that a backwards generator starts at -1 when the table only has
+        positive stream IDs."""
+
+        def _create(conn: LoggingDatabaseConnection) -> StreamIdGenerator:
+            return StreamIdGenerator(
+                db_conn=conn,
+                notifier=self.hs.get_replication_notifier(),
+                table="foobar",
+                column="stream_id",
+                step=-1,
+            )
+
+        id_gen = self.get_success_or_raise(self.db_pool.runWithConnection(_create))
+        self.assertEqual(id_gen.get_current_token(), -1)
+
     def test_single_gen_next(self) -> None:
         """Check that we correctly increment the current token from the DB."""
         id_gen = self._create_id_generator()
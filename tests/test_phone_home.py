@@ -82,6 +82,23 @@ class CommonMetricsTestCase(HomeserverTestCase):
 
         self._assert_metric_value("daily_active_users", 1)
 
+    def test_dau_cached(self) -> None:
+        """Tests that the daily active users count is only recalculated once the
+        cached value has expired."""
+        self._assert_metric_value("daily_active_users", 0)
+
+        self.register_user("user", "password")
+        tok = self.login("user", "password")
+        self.make_request("GET", "/sync", access_token=tok)
+
+        # Wait for the client IPs to be persisted, which is well within the
+        # lifetime of the cached count.
+        self.reactor.advance(10)
+        self._assert_metric_value("daily_active_users", 0)
+
+        self.reactor.advance(60)
+        self._assert_metric_value("daily_active_users", 1)
+
     def _assert_metric_value(self, metric_name: str, expected: int) -> None:
         """Compare the given value to the current value of the common usage metric with
         the given name.